@@ -27,6 +27,7 @@ setup(
     ],
     extras_require={
         "test": ["pytest"],
+        "fast": ["orjson"],
         "build": ["pyinstaller>=6.0"],
     }
 )
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 import os
 import random
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
@@ -22,10 +24,32 @@ from .model import (Action, Direction, Effect, Fruit, GameMode, GameState,
                     PowerUp, ScorePopup, Snake, WallMode, bfs_distances,
                     pick_kind)
 
+try:  # optional fast JSON codec; the stdlib path below is always available
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 
 # Menu actions, in display order. "start" launches a wrap-walls game,
 # "classic" launches solid-walls — each has its own high-score table.
 _MENU_ACTIONS = ("start", "classic", "scores", "help", "quit")
+_MENU_LABELS = {
+    "start": "Start Game",
+    "classic": "Classic Game",
+    "scores": "High Scores",
+    "help": "Help",
+    "quit": "Quit",
+}
+
+# Initials cycle through blank + A-Z; ↑/↓ step through this ring. Kept as
+# bytes because current_initials is a bytearray of these code points.
+_ALPHABET = b" ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_ALPHA_IDX = {ch: i for i, ch in enumerate(_ALPHABET)}
+
+# SPEED_LEVELS flattened into a tuple indexed by `level - 1`, so the per-frame
+# tick_rate lookup is a plain index instead of a dict probe.
+_SPEED_TABLE = tuple(SPEED_LEVELS[lvl] for lvl in sorted(SPEED_LEVELS))
+_MAX_LEVEL = len(_SPEED_TABLE)
 
 
 def _default_highscore_path(mode: WallMode) -> str:
@@ -53,7 +77,7 @@ def _split_paths(highscore_path: Optional[str]) -> Dict[WallMode, str]:
 # High-score persistence
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class HighScoreEntry:
     score: int
     timestamp: float
@@ -70,71 +94,169 @@ class HighScoreEntry:
                    initials=str(d.get("initials", "---")))
 
 
+def _neg_score(entry: HighScoreEntry) -> int:
+    """Sort key that orders entries highest score first."""
+    return -entry.score
+
+
 class HighScoreManager:
     """Manage persisted high-score list."""
 
     DEFAULT_PATH = os.path.join(
         os.path.dirname(__file__), "data", "highscores.json")
 
+    # One writer thread shared by every table, so saves queued from add()
+    # never block the game loop and always land on disk in order. Executor
+    # threads are joined at interpreter exit, so queued saves still flush.
+    _writer = ThreadPoolExecutor(max_workers=1,
+                                 thread_name_prefix="highscores")
+    _pending: Dict[str, Future] = {}
+
+    # Parsed tables keyed by path, tagged with the file's (mtime_ns, size) at
+    # parse time. Every GameEngine builds a fresh manager, so without this a
+    # menu -> new game round trip re-reads and re-parses an unchanged file.
+    _cache: Dict[str, Tuple[Tuple[int, int], List[HighScoreEntry]]] = {}
+
     def __init__(self, path: Optional[str] = None,
                  max_entries: int = MAX_HIGH_SCORE_ENTRIES):
         self.path = path or self.DEFAULT_PATH
         self.max_entries = max_entries
+        # Kept sorted by score, highest first (ties in insertion order), so
+        # best/threshold reads are O(1) — the HUD asks for them every frame.
         self._scores: List[HighScoreEntry] = []
+        # This table's most recently submitted save, for coalescing.
+        self._queued: Optional[Future] = None
         self.load()
 
     # -- persistence ---------------------------------------------------------
 
     def load(self) -> None:
+        # A save queued by another manager for the same file must land
+        # first, or we'd read the stale leaderboard.
+        pending = self._pending.get(self.path)
+        if pending is not None:
+            wait((pending,))
         try:
-            with open(self.path, "r") as fh:
-                data = json.load(fh)
-            if not isinstance(data, list):
-                data = []
-            self._scores = [HighScoreEntry.from_dict(e) for e in data]
+            st = os.stat(self.path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(self.path)
+            if cached is not None and cached[0] == stamp:
+                self._scores = list(cached[1])
+            else:
+                with open(self.path, "rb") as fh:
+                    raw = fh.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                if not isinstance(data, list):
+                    data = []
+                self._scores = [HighScoreEntry.from_dict(e) for e in data]
+                self._scores.sort(key=_neg_score)
+                self._cache[self.path] = (stamp, list(self._scores))
         except (OSError, json.JSONDecodeError, UnicodeDecodeError,
                 TypeError, KeyError, ValueError):
             self._scores = []
 
     def save(self) -> None:
+        """Persist the current scores and wait for them to hit disk.
+
+        Goes through the writer thread like `save_async()`, so it can't race
+        a queued write over the shared temp file or be overwritten by an
+        older snapshot landing after it.
+        """
+        self.save_async()
+        self.flush()
+
+    def save_async(self) -> None:
+        """Queue a save of the current scores on the writer thread and return
+        immediately. Use `flush()` to wait for it.
+
+        Saves coalesce: while this table's previous save is still queued
+        (not yet started), it will pick up the latest scores when it runs,
+        so a burst of add()s costs one write rather than one each.
+        """
+        queued = self._queued
+        if (queued is not None and queued is self._pending.get(self.path)
+                and not queued.running() and not queued.done()):
+            return
+        self._queued = self._pending[self.path] = self._writer.submit(
+            self._write_snapshot)
+
+    def _write_snapshot(self) -> None:
+        # Runs on the writer thread: snapshot at write time, not submit
+        # time. Sliced, so a concurrent add() between insort and trim can't
+        # leak an extra entry to disk.
+        self._write(self.path, self._scores[:self.max_entries])
+
+    def flush(self) -> None:
+        """Block until this manager's queued save has hit disk. Re-raises
+        the error if that save failed."""
+        queued = self._queued
+        if queued is None:
+            return
+        self._queued = None
+        # Only clear the path's entry if it is ours — another manager on
+        # the same file must still see (and re-raise) its own save.
+        if self._pending.get(self.path) is queued:
+            del self._pending[self.path]
+        queued.result()
+
+    @staticmethod
+    def _write(path: str, entries: List[HighScoreEntry]) -> None:
         """Persist scores atomically — write to a temp file, then rename.
 
         Why: a crash or kill mid-write would otherwise leave a truncated/empty
         JSON file and silently wipe the leaderboard on next load.
         """
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        tmp_path = self.path + ".tmp"
-        with open(tmp_path, "w") as fh:
-            json.dump([e.to_dict() for e in self._scores], fh, indent=2)
-        os.replace(tmp_path, self.path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        # Build the payload inline rather than via to_dict() per entry.
+        payload = [{"score": e.score, "timestamp": e.timestamp,
+                    "initials": e.initials} for e in entries]
+        # Encode up front and hand the file a single bytes write, instead of
+        # json.dump()'s stream of small text-mode writes.
+        if orjson:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(payload, indent=2).encode("utf-8")
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            st = os.fstat(fh.fileno())
+        os.replace(tmp_path, path)
+        # The rename keeps the inode, so this stamp matches what load() will
+        # stat — the next manager on this path reuses the entries unparsed.
+        HighScoreManager._cache[path] = ((st.st_mtime_ns, st.st_size),
+                                         list(entries))
 
     # -- queries -------------------------------------------------------------
 
     def get_top(self, n: Optional[int] = None) -> List[HighScoreEntry]:
         n = n or self.max_entries
-        return sorted(self._scores, key=lambda e: e.score, reverse=True)[:n]
+        return self._scores[:n]
 
     def is_high_score(self, score: int) -> bool:
-        if len(self._scores) < self.max_entries:
+        if not self._scores or len(self._scores) < self.max_entries:
             return score > 0
-        return score > min(e.score for e in self._scores)
+        return score > self._scores[-1].score
 
     @property
     def best(self) -> int:
-        return max((e.score for e in self._scores), default=0)
+        return self._scores[0].score if self._scores else 0
 
     # -- mutations -----------------------------------------------------------
 
     def add(self, score: int, initials: str = "---") -> None:
-        """Add a score if it qualifies for the leaderboard. No-op otherwise."""
+        """Add a score if it qualifies for the leaderboard. No-op otherwise.
+
+        The in-memory table updates immediately; the disk write is queued on
+        the writer thread so the caller (the game loop) never waits on I/O.
+        """
         if not self.is_high_score(score):
             return
         entry = HighScoreEntry(score=score, timestamp=time.time(),
                                initials=initials)
-        self._scores.append(entry)
-        self._scores = sorted(self._scores, key=lambda e: e.score,
-                              reverse=True)[:self.max_entries]
-        self.save()
+        bisect.insort(self._scores, entry, key=_neg_score)
+        del self._scores[self.max_entries:]
+        self.save_async()
 
 
 # ---------------------------------------------------------------------------
@@ -178,8 +300,8 @@ class GameEngine:
         self.speed_buff_until: float = 0.0
         self.speed_buff_label: str = ""
 
-        # Initials entry state
-        self.current_initials: List[str] = ['A'] * INITIALS_LENGTH
+        # Initials entry state — one ASCII byte per letter, edited in place.
+        self.current_initials: bytearray = bytearray(b"A" * INITIALS_LENGTH)
         self.initials_cursor: int = 0
 
         # "Just one more" engagement state. Tracked across games within a
@@ -196,6 +318,29 @@ class GameEngine:
         self._pre_quit_state: GameState = GameState.MENU
         self.confirm_quit_index: int = 0
 
+        # Per-state input handlers, looked up once per key press. States not
+        # listed here (QUIT) ignore input.
+        self._input_dispatch = {
+            GameState.MENU: self._handle_menu_input,
+            GameState.PLAYING: self._handle_playing_input,
+            GameState.PAUSED: self._handle_paused_input,
+            GameState.GAME_OVER: self._handle_game_over_input,
+            GameState.ENTER_INITIALS: self._handle_initials_input,
+            GameState.CONFIRM_QUIT: self._handle_confirm_quit_input,
+            GameState.HIGH_SCORES: self._handle_overlay_input,
+            GameState.HELP: self._handle_overlay_input,
+        }
+        # What SELECT does on each menu entry, keyed by _MENU_ACTIONS id.
+        # "quit" routes through the confirm overlay so it matches the Q-key
+        # behavior — never quit without asking.
+        self._menu_dispatch = {
+            "start": lambda: self.new_game(GameMode.MODERN),
+            "classic": lambda: self.new_game(GameMode.CLASSIC),
+            "scores": lambda: setattr(self, "state", GameState.HIGH_SCORES),
+            "help": lambda: setattr(self, "state", GameState.HELP),
+            "quit": self._open_quit_confirm,
+        }
+
     # -- ergonomic attribute aliases ----------------------------------------
     # Tests and external readers often think in terms of "food" / "bonus"
     # rather than the internal "fruit" / "power_up" names. These are tiny
@@ -221,7 +366,8 @@ class GameEngine:
 
     @property
     def tick_rate(self) -> float:
-        base = SPEED_LEVELS[self.level]
+        level = self.level
+        base = _SPEED_TABLE[level - 1] if level <= _MAX_LEVEL else _SPEED_TABLE[-1]
         if self.speed_buff_until and time.time() < self.speed_buff_until:
             return base * self.speed_multiplier
         return base
@@ -252,26 +398,19 @@ class GameEngine:
         shows wrap and classic side-by-side."""
         return self._high_scores[mode]
 
+    def flush_high_scores(self) -> None:
+        """Wait for queued high-score saves of both modes to hit disk.
+        Re-raises the error if a save failed."""
+        for mgr in self._high_scores.values():
+            mgr.flush()
+
     @property
     def menu_items(self) -> List[str]:
         """Display labels for the menu, in order."""
-        return [self._menu_label(a) for a in _MENU_ACTIONS]
-
-    def _menu_label(self, action: str) -> str:
-        if action == "start":
-            return "Start Game"
-        if action == "classic":
-            return "Classic Game"
-        if action == "scores":
-            return "High Scores"
-        if action == "help":
-            return "Help"
-        if action == "quit":
-            return "Quit"
-        return action
+        return [_MENU_LABELS[a] for a in _MENU_ACTIONS]
 
     def _recompute_level(self) -> None:
-        self.level = min(len(SPEED_LEVELS), 1 + self.score // POINTS_PER_LEVEL)
+        self.level = min(_MAX_LEVEL, 1 + self.score // POINTS_PER_LEVEL)
 
     # -- init / reset --------------------------------------------------------
 
@@ -338,8 +477,8 @@ class GameEngine:
         """Distance map from the snake's head, minus extra blocked cells."""
         wrap = self.wall_mode == WallMode.WRAP
         head = self.snake.get_head()
-        body = self.snake.get_body()
-        dists = bfs_distances(body, head, self.width, self.height, wrap)
+        dists = bfs_distances(self.snake.body, head, self.width, self.height,
+                              wrap)
         for extra in extra_obstacles:
             dists.pop(extra, None)
         return dists
@@ -375,7 +514,7 @@ class GameEngine:
             self.fruit.place(pos=cell)
             return
         # Pathological: head walled off entirely. Random non-body cell.
-        self.fruit.place(snake_body=self.snake.get_body())
+        self.fruit.place(snake_body=self.snake.occupied)
 
     def _spawn_power_up_pathfinder(self) -> None:
         """Spawn a power-up on a cell reachable within its lifetime.
@@ -409,20 +548,9 @@ class GameEngine:
         if self._handle_common_input(inp):
             return
 
-        if self.state == GameState.MENU:
-            self._handle_menu_input(inp)
-        elif self.state == GameState.PLAYING:
-            self._handle_playing_input(inp)
-        elif self.state == GameState.PAUSED:
-            self._handle_paused_input(inp)
-        elif self.state == GameState.GAME_OVER:
-            self._handle_game_over_input(inp)
-        elif self.state == GameState.ENTER_INITIALS:
-            self._handle_initials_input(inp)
-        elif self.state == GameState.CONFIRM_QUIT:
-            self._handle_confirm_quit_input(inp)
-        elif self.state in (GameState.HIGH_SCORES, GameState.HELP):
-            self._handle_overlay_input(inp)
+        handler = self._input_dispatch.get(self.state)
+        if handler is not None:
+            handler(inp)
 
     def _handle_common_input(self, inp: Union[Direction, Action]) -> bool:
         """Handle actions common across multiple states. Returns True if handled."""
@@ -431,11 +559,7 @@ class GameEngine:
             if self.state == GameState.CONFIRM_QUIT:
                 self.state = self._pre_quit_state
                 return True
-            # Otherwise open the "Are you sure?" overlay. The default button
-            # is "Stay" (index 0) so an accidental Enter doesn't quit.
-            self._pre_quit_state = self.state
-            self.confirm_quit_index = 0
-            self.state = GameState.CONFIRM_QUIT
+            self._open_quit_confirm()
             return True
 
         # MENU action returns to menu from most states. Going back to the
@@ -457,21 +581,15 @@ class GameEngine:
         elif inp in (Direction.DOWN, Action.MENU_DOWN):
             self.menu_index = (self.menu_index + 1) % len(_MENU_ACTIONS)
         elif inp in (Action.SELECT, Action.START):
-            action = _MENU_ACTIONS[self.menu_index]
-            if action == "start":
-                self.new_game(GameMode.MODERN)
-            elif action == "classic":
-                self.new_game(GameMode.CLASSIC)
-            elif action == "scores":
-                self.state = GameState.HIGH_SCORES
-            elif action == "help":
-                self.state = GameState.HELP
-            elif action == "quit":
-                # Route through the confirm overlay so this matches the
-                # Q-key behavior — never quit without asking.
-                self._pre_quit_state = GameState.MENU
-                self.confirm_quit_index = 0
-                self.state = GameState.CONFIRM_QUIT
+            self._menu_dispatch[_MENU_ACTIONS[self.menu_index]]()
+
+    def _open_quit_confirm(self) -> None:
+        """Open the "Are you sure?" overlay over the current state. The
+        default button is "Stay" (index 0) so an accidental Enter doesn't
+        quit."""
+        self._pre_quit_state = self.state
+        self.confirm_quit_index = 0
+        self.state = GameState.CONFIRM_QUIT
 
     def _handle_playing_input(self, inp: Union[Direction, Action]) -> None:
         if isinstance(inp, Direction):
@@ -521,7 +639,7 @@ class GameEngine:
             self.initials_cursor = max(self.initials_cursor - 1, 0)
         elif inp == Action.SELECT:
             # Confirm and save
-            initials = ''.join(self.current_initials)
+            initials = self.current_initials.decode("ascii")
             self.high_scores.add(self.score, initials)
             self.state = GameState.GAME_OVER
         elif inp == Action.MENU:
@@ -532,16 +650,9 @@ class GameEngine:
 
     def _cycle_initial(self, delta: int) -> None:
         """Cycle current initial character up or down."""
-        current = self.current_initials[self.initials_cursor]
-        if current == ' ':
-            new_char = 'A' if delta > 0 else 'Z'
-        elif current == 'A' and delta < 0:
-            new_char = ' '
-        elif current == 'Z' and delta > 0:
-            new_char = 'A'
-        else:
-            new_char = chr(ord(current) + delta)
-        self.current_initials[self.initials_cursor] = new_char
+        cursor = self.initials_cursor
+        i = (_ALPHA_IDX[self.current_initials[cursor]] + delta) % len(_ALPHABET)
+        self.current_initials[cursor] = _ALPHABET[i]
 
     # -- effects / popups ---------------------------------------------------
 
@@ -658,7 +769,7 @@ class GameEngine:
         self.near_miss_message = self._compute_near_miss()
 
         if self.high_scores.is_high_score(self.score):
-            self.current_initials = ['A'] * INITIALS_LENGTH
+            self.current_initials[:] = b"A" * INITIALS_LENGTH
             self.initials_cursor = 0
             self.state = GameState.ENTER_INITIALS
         else:
@@ -21,6 +21,33 @@ _BLOCKING_STATES = frozenset({
     GameState.CONFIRM_QUIT,
 })
 
+# time.sleep() can overshoot by a scheduler quantum (1-15 ms depending on
+# the OS), so tick waits sleep until this close to the deadline and spin
+# the rest. The spin is capped so a stalled clock can't hang the loop.
+_SPIN_WINDOW_NS = 2_000_000
+_SPIN_LIMIT = 200_000
+
+# getch timeouts are whole milliseconds; below this the tick wait is left
+# to _sleep_until().
+_GETCH_RESOLUTION_NS = 1_000_000
+
+# How long (ms) the paused screen blocks in getch before redrawing.
+_PAUSED_POLL_MS = 50
+
+
+def _sleep_until(deadline_ns: int) -> None:
+    """Wait until `time.perf_counter_ns()` reaches `deadline_ns`."""
+    remaining = deadline_ns - time.perf_counter_ns()
+    if remaining > _SPIN_WINDOW_NS:
+        time.sleep((remaining - _SPIN_WINDOW_NS) / 1e9)
+    for _ in range(_SPIN_LIMIT):
+        if time.perf_counter_ns() >= deadline_ns:
+            break
+
+
+def _to_ns(seconds: float) -> int:
+    return int(seconds * 1_000_000_000)
+
 
 class SnakeGame:
     """Main game controller."""
@@ -37,36 +64,79 @@ class SnakeGame:
         try:
             self._loop()
         finally:
-            self.ui.stop()
+            try:
+                self.ui.stop()
+            finally:
+                # Saves run on a background thread; wait for them (and let a
+                # failed write surface) only once the terminal is restored.
+                self.engine.flush_high_scores()
 
     def _loop(self) -> None:
-        last_tick = time.time()
-
-        while self.engine.state != GameState.QUIT:
-            state = self.engine.state
-            blocking = state in _BLOCKING_STATES
-
-            if blocking:
+        # Hoisted: the loop body reads these on every pass.
+        engine = self.engine
+        ui = self.ui
+        perf_counter_ns = time.perf_counter_ns
+        # Ticks are scheduled on an absolute perf_counter_ns() timeline, in
+        # integer nanoseconds: advancing the deadline by one period (rather
+        # than restarting it from "now") keeps sleep overshoot from
+        # accumulating as drift, and int math never rounds.
+        next_tick = perf_counter_ns() + _to_ns(engine.tick_rate)
+
+        while True:
+            state = engine.state
+            if state == GameState.QUIT:
+                break
+
+            if state in _BLOCKING_STATES:
                 self._render_overlays()
-                inp = self.ui.wait_for_key()
+                inputs = (ui.wait_for_key(),)
+            elif state == GameState.PLAYING:
+                self._render_frame()
+                # Block in getch until a key arrives or the tick is due, so
+                # the process sleeps in the kernel and keys wake it at once.
+                while True:
+                    wait_ms = (next_tick - perf_counter_ns()) // 1_000_000
+                    ui.set_timeout(max(0, wait_ms))
+                    inp = ui.get_input()
+                    # None is also an unmapped key (KEY_RESIZE, the tail of
+                    # an escape sequence): go back to getch with the shorter
+                    # timeout unless the tick is under a millisecond away.
+                    if inp is not None:
+                        break
+                    if next_tick - perf_counter_ns() < _GETCH_RESOLUTION_NS:
+                        break
+                if inp is None:
+                    # getch only has ms resolution, so finish the last
+                    # fraction precisely.
+                    _sleep_until(next_tick)
+                    inputs = ()
+                else:
+                    # A key woke us. Take everything else already typed as
+                    # well: one loop pass (and render) per burst rather than
+                    # per key. Keys apply in order, each checked against the
+                    # last move, so the last valid direction wins this tick.
+                    inputs = [inp, *ui.drain_input()]
             else:
-                inp = self.ui.get_input()
+                self._render_frame()
+                ui.set_timeout(_PAUSED_POLL_MS)
+                inputs = (ui.get_input(),)
 
-            self.engine.handle_input(inp)
+            for inp in inputs:
+                engine.handle_input(inp)
 
-            # --- Playing / Paused (non-blocking input) ---
+            # --- Playing: advance on schedule ---
             if state == GameState.PLAYING:
-                now = time.time()
-                if now - last_tick >= self.engine.tick_rate:
-                    self.engine.tick()
-                    last_tick = now
+                now = perf_counter_ns()
+                if now >= next_tick:
+                    engine.tick()
+                    next_tick += _to_ns(engine.tick_rate)
+                    # More than a whole period behind (a stall, a slow
+                    # terminal): resync rather than burst catch-up ticks.
+                    if next_tick < now:
+                        next_tick = now + _to_ns(engine.tick_rate)
             else:
                 # Reset tick timer when not playing to avoid burst on resume
-                last_tick = time.time()
-
-            # --- Playing / Paused (render) ---
-            if state in (GameState.PLAYING, GameState.PAUSED):
-                self._render_frame()
+                next_tick = perf_counter_ns() + _to_ns(engine.tick_rate)
 
     def _render_overlays(self) -> None:
         """Render overlay screens (menu, high scores, help, etc.)."""
@@ -97,18 +167,22 @@ class SnakeGame:
                 near_miss=engine.near_miss_message,
             )
         elif state == GameState.ENTER_INITIALS:
-            self.ui.show_enter_initials(engine.score,
-                                        engine.current_initials,
-                                        engine.initials_cursor)
+            self.ui.show_enter_initials(
+                engine.score,
+                engine.current_initials.decode("ascii"),
+                engine.initials_cursor,
+            )
         elif state == GameState.CONFIRM_QUIT:
             self.ui.show_confirm_quit(engine.confirm_quit_index)
 
     def _render_frame(self) -> None:
         """Render game frame for playing or paused state."""
         engine = self.engine
+        ui = self.ui
+        snake = engine.snake
         # Re-center the playfield for the current game's dimensions. Cheap
         # idempotent call — no-op when already at the right size.
-        self.ui.set_play_area(engine.width, engine.height)
+        ui.set_play_area(engine.width, engine.height)
         fruit = engine.fruit
         power = engine.power_up
         if power and power.active:
@@ -127,14 +201,15 @@ class SnakeGame:
             bonus_name = ""
             bonus_points = 0
             bonus_remaining = 0.0
-        self.ui.render_frame(
-            engine.snake.get_body(),
+        ui.render_frame(
+            # The live deque, not get_body()'s copy — we only iterate it.
+            snake.body,
             fruit.get_position(),
             engine.score,
             engine.high_score,
             engine.level,
             paused=(engine.state == GameState.PAUSED),
-            snake_direction=engine.snake.direction,
+            snake_direction=snake.direction,
             food_char=fruit.get_char(),
             food_color=fruit.get_color(),
             food_name=fruit.kind.name,
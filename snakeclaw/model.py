@@ -3,9 +3,11 @@
 import random
 import time
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from itertools import islice
+from typing import (Collection, Deque, Dict, Iterable, List, Optional,
+                    Sequence, Set, Tuple)
 
 
 class Direction(Enum):
@@ -78,6 +80,11 @@ OPPOSITE: Dict[Direction, Direction] = {
     Direction.RIGHT: Direction.LEFT,
 }
 
+# (row, col) step -> Direction, for reading a Snake's heading back out of
+# the raw deltas it stores.
+_DELTA_TO_DIR: Dict[Tuple[int, int], Direction] = {
+    d.value: d for d in Direction}
+
 
 # ---------------------------------------------------------------------------
 # Fruit / power-up descriptors
@@ -127,29 +134,64 @@ class Snake:
 
     def __init__(self, start_pos: Tuple[int, int], length: int = 3,
                  direction: Direction = Direction.UP):
-        self.direction: Direction = direction
-        self._last_moved_direction: Direction = direction
-        self.body: List[Tuple[int, int]] = [start_pos]
+        self.direction = direction
+        # The (dx, dy) of the last move. Kept raw so move() does no Enum
+        # lookup; set_direction() maps it back only when a key arrives.
+        self._last_step: Tuple[int, int] = direction.value
+        # Head at body[0]. A deque so move() can push the head and drop the
+        # tail in O(1) — list.insert(0, ...) shifts every segment.
+        self._body: Deque[Tuple[int, int]] = deque([start_pos])
         dx, dy = direction.value
         current_pos = start_pos
         for _ in range(1, length):
             current_pos = (current_pos[0] - dx, current_pos[1] - dy)
-            self.body.append(current_pos)
+            self._body.append(current_pos)
+        # Occupied cells, kept in step with _body so "is this cell on the
+        # snake?" is a hash probe instead of a scan of every segment.
+        self._body_set: Set[Tuple[int, int]] = set(self._body)
         self.grow: bool = False
 
+    # The heading is stored only as the raw (_dx, _dy) step that move() and
+    # compute_next_head() add every tick — no Enum access on that path.
+    # `direction` maps to and from the public Direction type on demand.
+
+    @property
+    def direction(self) -> Direction:
+        return _DELTA_TO_DIR[self._dx, self._dy]
+
+    @direction.setter
+    def direction(self, direction: Direction) -> None:
+        self._dx, self._dy = direction.value
+
+    @property
+    def body(self) -> Deque[Tuple[int, int]]:
+        return self._body
+
+    @body.setter
+    def body(self, segments: Iterable[Tuple[int, int]]) -> None:
+        self._body = deque(segments)
+        self._body_set = set(self._body)
+
+    @property
+    def occupied(self) -> Set[Tuple[int, int]]:
+        """The set of cells the body covers. Live — don't mutate it."""
+        return self._body_set
+
     def move(self, new_head: Optional[Tuple[int, int]] = None) -> None:
         """Move the snake one step. Pass `new_head` to override the computed
         position (e.g. when the engine has applied wall-wrap)."""
         if new_head is None:
-            head = self.body[0]
-            new_head = (head[0] + self.direction.value[0],
-                        head[1] + self.direction.value[1])
-        self.body.insert(0, new_head)
+            head = self._body[0]
+            new_head = (head[0] + self._dx, head[1] + self._dy)
+        # Drop the tail before adding the head: when the head moves into the
+        # cell the tail is leaving, the cell must stay marked occupied.
         if self.grow:
             self.grow = False
         else:
-            self.body.pop()
-        self._last_moved_direction = self.direction
+            self._body_set.discard(self._body.pop())
+        self._body.appendleft(new_head)
+        self._body_set.add(new_head)
+        self._last_step = (self._dx, self._dy)
 
     def set_direction(self, direction: Direction) -> None:
         """Change direction, preventing 180-degree turns.
@@ -158,7 +200,9 @@ class Snake:
         two perpendicular inputs within a single tick (e.g. RIGHT → UP → LEFT)
         can stack into a 180° turn that drives the head into its own neck.
         """
-        if direction == OPPOSITE.get(self._last_moved_direction):
+        # Enum members are singletons, so identity is enough (and skips
+        # Enum.__eq__).
+        if direction is OPPOSITE[_DELTA_TO_DIR[self._last_step]]:
             return
         self.direction = direction
 
@@ -169,17 +213,27 @@ class Snake:
         return self.body[-1]
 
     def get_body(self) -> List[Tuple[int, int]]:
-        return self.body.copy()
+        """A list copy of the body, head first. Callers that only iterate
+        (the renderer, BFS) should read `body` and skip the copy."""
+        return list(self.body)
 
     @staticmethod
     def _out_of_bounds(pos: Tuple[int, int], width: int, height: int) -> bool:
         r, c = pos
-        return r < 0 or r >= height or c < 0 or c >= width
+        # (r | c) is negative iff either coordinate is, so one compare
+        # covers both lower bounds.
+        return (r | c) < 0 or r >= height or c >= width
 
     def check_collision(self, width: int, height: int) -> bool:
         """Check if the snake has collided with walls or itself."""
-        head = self.get_head()
-        return self._out_of_bounds(head, width, height) or head in self.body[1:]
+        head = self._body[0]
+        if self._out_of_bounds(head, width, height):
+            return True
+        # Segments only share a cell once the head has run into the body,
+        # and then the set holds fewer cells than the deque — so the scan
+        # runs only on the tick the snake actually collides.
+        return (len(self._body_set) < len(self._body)
+                and head in islice(self._body, 1, None))
 
     def compute_next_head(self, width: int, height: int,
                           wrap: bool = False) -> Tuple[int, int]:
@@ -187,9 +241,8 @@ class Snake:
 
         With wrap=False, the result may be out of bounds — callers must check.
         """
-        head = self.body[0]
-        raw = (head[0] + self.direction.value[0],
-               head[1] + self.direction.value[1])
+        head = self._body[0]
+        raw = (head[0] + self._dx, head[1] + self._dy)
         if wrap:
             return (raw[0] % height, raw[1] % width)
         return raw
@@ -203,8 +256,9 @@ class Snake:
         new_head = self.compute_next_head(width, height, wrap=wrap)
         if not wrap and self._out_of_bounds(new_head, width, height):
             return True
-        body_to_check = self.body if self.grow else self.body[:-1]
-        return new_head in body_to_check
+        # The tail moves out of the way this tick unless we're growing.
+        return new_head in self._body_set and (
+            self.grow or new_head != self._body[-1])
 
     def grow_snake(self) -> None:
         """Mark the snake to grow by one segment."""
@@ -217,7 +271,7 @@ class Snake:
         """
         removed = 0
         while removed < amount and len(self.body) > 1:
-            self.body.pop()
+            self._body_set.discard(self._body.pop())
             removed += 1
         return removed
 
@@ -244,7 +298,7 @@ class Fruit:
     # -- placement ----------------------------------------------------------
 
     def place(self, pos: Optional[Tuple[int, int]] = None,
-              snake_body: Optional[List[Tuple[int, int]]] = None,
+              snake_body: Optional[Collection[Tuple[int, int]]] = None,
               kind: Optional[FruitKind] = None) -> None:
         """Place the fruit. `kind` overrides the random pick if given.
 
@@ -255,12 +309,30 @@ class Fruit:
         if pos is not None:
             self.position = pos
             return
-        while True:
-            p = (random.randint(0, self.height - 1),
-                 random.randint(0, self.width - 1))
-            if snake_body is None or p not in snake_body:
-                self.position = p
-                return
+        if snake_body is None:
+            occupied: Collection[Tuple[int, int]] = ()
+        elif isinstance(snake_body, (set, frozenset)):
+            occupied = snake_body  # already O(1) membership; no copy
+        else:
+            occupied = set(snake_body)
+        width, height = self.width, self.height
+        cells = width * height
+        if 2 * len(occupied) < cells:
+            # Mostly empty board: each random draw is more likely free than
+            # not, so rejection sampling finishes in a couple of tries.
+            randrange = random.randrange  # bound once for the retry loop
+            while True:
+                # One RNG call per try: draw a flat index and split it.
+                p = divmod(randrange(cells), width)
+                if p not in occupied:
+                    self.position = p
+                    return
+        # Crowded board: retries would grow without bound as the snake fills
+        # it, so enumerate the free cells once and pick from those.
+        free = [(r, c) for r in range(height) for c in range(width)
+                if (r, c) not in occupied]
+        if free:
+            self.position = random.choice(free)
 
     # -- queries ------------------------------------------------------------
 
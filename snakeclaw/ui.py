@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import curses
 import time
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from .constants import (
     BONUS_FOOD_CHAR, COLOR_BORDER, COLOR_FOOD, COLOR_HIGHLIGHT,
@@ -16,35 +17,139 @@ from .constants import (
 )
 from .model import Action, Direction, ScorePopup, WallMode
 
+# One recorded addstr during a buffered play frame: (col, text, attr).
+_Write = Tuple[int, str, int]
+
+# One positioned string of a static screen layout:
+# (row, col, text, color pair, bold). Kept free of curses attribute values
+# so layouts can be computed (and cached) before curses is initialised.
+_Cell = Tuple[int, int, str, int, bool]
+
+
+def _centered(win_w: int, width: int) -> int:
+    """Column that centers `width` cells in a `win_w`-wide window."""
+    return max(0, win_w // 2 - width // 2)
+
+
+@lru_cache(maxsize=8)
+def _center_line(text: str, width: int) -> str:
+    """`text` centered in, and clipped to, `width` columns."""
+    return text.center(width)[:width]
+
+
+@lru_cache(maxsize=8)
+def _menu_layout(items: Tuple[str, ...], selected: int, high_score: int,
+                 win_w: int, win_h: int) -> Tuple[_Cell, ...]:
+    """Lay out the main menu. Pure in its arguments, so re-showing the menu
+    (every key press while it's up) reuses the cached strings."""
+    cells: List[_Cell] = []
+
+    # Calculate widths for the menu box
+    max_item_len = max(len(MENU_MARKER + item) for item in items)
+    box_inner = max_item_len + 2  # padding inside box
+    box_w = box_inner + 2  # +2 for borders
+
+    # Calculate total content height for vertical centering
+    logo_lines = len(GAME_TITLE)
+    # box: top border + items (1 row each) + bottom border
+    box_h = len(items) + 2
+    total_h = logo_lines + 2 + box_h + 2  # +gaps
+    start_row = max(1, (win_h - total_h) // 2)
+
+    # ASCII art title - center each line
+    for i, line in enumerate(GAME_TITLE):
+        cells.append((start_row + i, _centered(win_w, len(line)), line,
+                      COLOR_SNAKE, True))
+
+    # Menu box
+    menu_start = start_row + logo_lines + 2
+    box_col = _centered(win_w, box_w)
+
+    # Top border
+    top = "╔" + "═" * box_inner + "╗"
+    cells.append((menu_start, box_col, top, COLOR_BORDER, False))
+
+    # Items
+    for i, item in enumerate(items):
+        marker = MENU_MARKER if i == selected else MENU_SPACER
+        label = f"{marker}{item}"
+        padded = label.ljust(box_inner)
+        row = menu_start + 1 + i
+        if i == selected:
+            pair, bold = COLOR_HIGHLIGHT, True
+        else:
+            pair, bold = COLOR_TITLE, False
+        cells.append((row, box_col, "║", COLOR_BORDER, False))
+        cells.append((row, box_col + 1, padded, pair, bold))
+        cells.append((row, box_col + 1 + box_inner, "║", COLOR_BORDER, False))
+
+    # Bottom border
+    bot = "╚" + "═" * box_inner + "╝"
+    cells.append((menu_start + 1 + len(items), box_col, bot,
+                  COLOR_BORDER, False))
+
+    # High score below box
+    if high_score > 0:
+        hs = f"★ Best: {high_score} ★"
+        hs_row = menu_start + box_h + 1
+        cells.append((hs_row, _centered(win_w, len(hs)), hs, COLOR_HUD, True))
+
+    # Hint at bottom
+    cells.append((win_h - 1, _centered(win_w, len(MENU_HINT)), MENU_HINT,
+                  COLOR_BORDER, False))
+    return tuple(cells)
+
+
+@lru_cache(maxsize=2)
+def _help_layout(win_w: int, win_h: int) -> Tuple[_Cell, ...]:
+    """Lay out the (static) help screen for a window size."""
+    cells: List[_Cell] = []
+    title = "╔═══════════════════╗"
+    title2 = "║    ? CONTROLS ?   ║"
+    title3 = "╚═══════════════════╝"
+    for row, line in ((2, title), (3, title2), (4, title3)):
+        cells.append((row, _centered(win_w, len(line)), line, COLOR_HUD, True))
+    start = 6
+    for i, line in enumerate(HELP_TEXT):
+        pair = (COLOR_SNAKE if line.startswith(("Arrow", "P ", "R ", "M ", "Q "))
+                else COLOR_TITLE)
+        cells.append((start + i, _centered(win_w, len(line)), line, pair, False))
+    cells.append((win_h - 1, _centered(win_w, len(RETURN_HINT)), RETURN_HINT,
+                  COLOR_BORDER, False))
+    return tuple(cells)
+
 
 # ---------------------------------------------------------------------------
 # Key mapping
 # ---------------------------------------------------------------------------
 
+# Curses key code -> input, built once at import.
+_KEY_MAP: Dict[int, Union[Direction, Action]] = {
+    curses.KEY_UP: Direction.UP,
+    curses.KEY_DOWN: Direction.DOWN,
+    curses.KEY_LEFT: Direction.LEFT,
+    curses.KEY_RIGHT: Direction.RIGHT,
+    ord('w'): Direction.UP, ord('W'): Direction.UP,
+    ord('s'): Direction.DOWN, ord('S'): Direction.DOWN,
+    ord('a'): Direction.LEFT, ord('A'): Direction.LEFT,
+    ord('d'): Direction.RIGHT, ord('D'): Direction.RIGHT,
+    ord('q'): Action.QUIT, ord('Q'): Action.QUIT,
+    ord('r'): Action.RESET, ord('R'): Action.RESET,
+    ord('p'): Action.PAUSE, ord('P'): Action.PAUSE,
+    ord('m'): Action.MENU, ord('M'): Action.MENU,
+    ord('y'): Action.YES, ord('Y'): Action.YES,
+    ord('n'): Action.NO, ord('N'): Action.NO,
+    ord(' '): Action.SELECT,
+    ord('\n'): Action.SELECT,
+    10: Action.SELECT,   # enter
+    13: Action.SELECT,   # carriage-return
+    27: Action.MENU,     # escape → back to menu
+}
+
+
 def map_key(key: int) -> Optional[Union[Direction, Action]]:
     """Convert a curses key code to a Direction or Action."""
-    mapping = {
-        curses.KEY_UP: Direction.UP,
-        curses.KEY_DOWN: Direction.DOWN,
-        curses.KEY_LEFT: Direction.LEFT,
-        curses.KEY_RIGHT: Direction.RIGHT,
-        ord('w'): Direction.UP, ord('W'): Direction.UP,
-        ord('s'): Direction.DOWN, ord('S'): Direction.DOWN,
-        ord('a'): Direction.LEFT, ord('A'): Direction.LEFT,
-        ord('d'): Direction.RIGHT, ord('D'): Direction.RIGHT,
-        ord('q'): Action.QUIT, ord('Q'): Action.QUIT,
-        ord('r'): Action.RESET, ord('R'): Action.RESET,
-        ord('p'): Action.PAUSE, ord('P'): Action.PAUSE,
-        ord('m'): Action.MENU, ord('M'): Action.MENU,
-        ord('y'): Action.YES, ord('Y'): Action.YES,
-        ord('n'): Action.NO, ord('N'): Action.NO,
-        ord(' '): Action.SELECT,
-        ord('\n'): Action.SELECT,
-        10: Action.SELECT,   # enter
-        13: Action.SELECT,   # carriage-return
-        27: Action.MENU,     # escape → back to menu
-    }
-    return mapping.get(key)
+    return _KEY_MAP.get(key)
 
 
 # ---------------------------------------------------------------------------
@@ -69,6 +174,19 @@ class CursesUI:
         self.play_origin_x = 0    # left edge of the play border on stdscr
         self.stdscr: Optional[curses.window] = None
         self._has_colors = False
+        # Last HUD stats line and the inputs it was built from.
+        self._stats_key: Optional[tuple] = None
+        self._stats_line = ""
+        # (color pair, bold) -> curses attribute; filled lazily by _attr().
+        self._attrs: Dict[Tuple[int, bool], int] = {}
+        # Damage tracking for play frames. While render_frame() runs,
+        # _safe_addstr() records writes into `_frame` (row -> ordered
+        # (col, text, attr) list) instead of drawing; the frame is then
+        # diffed against `_last_frame` and only rows that changed are
+        # repainted. `_last_frame` is None when the screen contents are
+        # unknown (nothing drawn yet) and {} right after an erase.
+        self._frame: Optional[Dict[int, List[_Write]]] = None
+        self._last_frame: Optional[Dict[int, List[_Write]]] = None
 
     def set_play_area(self, play_w: int, play_h: int) -> None:
         """Resize the inner playfield while keeping the outer canvas fixed.
@@ -107,6 +225,7 @@ class CursesUI:
             curses.init_pair(COLOR_SUCCESS, curses.COLOR_GREEN, -1)    # success
             curses.init_pair(COLOR_WARNING, curses.COLOR_RED, -1)      # warning
             self._has_colors = True
+        self._attrs.clear()  # color support is only known from here on
         self.stdscr.clear()
         self.stdscr.refresh()
 
@@ -131,6 +250,33 @@ class CursesUI:
             return None
         return map_key(key)
 
+    def drain_input(self) -> List[Union[Direction, Action]]:
+        """Return every key already waiting in the input buffer, mapped and
+        in arrival order, without blocking. Unmapped keys are dropped."""
+        if not self.stdscr:
+            return []
+        self.stdscr.nodelay(True)
+        getch = self.stdscr.getch
+        lookup = _KEY_MAP.get
+        inputs = []
+        while True:
+            try:
+                key = getch()
+            except curses.error:
+                break
+            if key == -1:
+                break
+            inp = lookup(key)
+            if inp is not None:
+                inputs.append(inp)
+        return inputs
+
+    def set_timeout(self, ms: int) -> None:
+        """Make the next get_input() block for up to `ms` milliseconds
+        (0 = don't block, -1 = block until a key arrives)."""
+        if self.stdscr:
+            self.stdscr.timeout(ms)
+
     def wait_for_key(self) -> Optional[Union[Direction, Action]]:
         """Block until a key is pressed."""
         if not self.stdscr:
@@ -140,7 +286,9 @@ class CursesUI:
             key = self.stdscr.getch()
         except curses.error:
             key = -1
-        self.stdscr.timeout(50)
+        # Back to non-blocking reads, as set up in start(); the game loop
+        # paces itself while playing.
+        self.stdscr.nodelay(True)
         if key == -1:
             return None
         return map_key(key)
@@ -148,14 +296,23 @@ class CursesUI:
     # -- helpers -------------------------------------------------------------
 
     def _attr(self, pair: int, bold: bool = False) -> int:
-        a = curses.color_pair(pair) if self._has_colors else 0
-        if bold:
-            a |= curses.A_BOLD
+        # Memoized: every draw call asks for an attribute, and
+        # curses.color_pair() is a C call each time otherwise.
+        key = (pair, bold)
+        a = self._attrs.get(key)
+        if a is None:
+            a = curses.color_pair(pair) if self._has_colors else 0
+            if bold:
+                a |= curses.A_BOLD
+            self._attrs[key] = a
         return a
 
     def _safe_addstr(self, row: int, col: int, text: str, attr: int = 0) -> None:
         if not self.stdscr:
             return
+        if self._frame is not None:
+            self._frame.setdefault(row, []).append((col, text, attr))
+            return
         try:
             self.stdscr.addstr(row, col, text, attr)
         except curses.error:
@@ -179,9 +336,26 @@ class CursesUI:
     def clear(self) -> None:
         if self.stdscr:
             self.stdscr.erase()
+            # Screen is blank now — the next play frame repaints every row.
+            self._last_frame = {}
+
+    def _paint_row(self, row: int, writes: List[_Write]) -> None:
+        """Blank one screen row and replay a frame's writes onto it."""
+        try:
+            self.stdscr.move(row, 0)
+            self.stdscr.clrtoeol()
+        except curses.error:
+            pass
+        for col, text, attr in writes:
+            try:
+                self.stdscr.addstr(row, col, text, attr)
+            except curses.error:
+                pass
 
     def refresh(self) -> None:
-        if self.stdscr:
+        # Inside render_frame() nothing has reached the window yet; the
+        # frame flushes once, after its diff is applied.
+        if self.stdscr and self._frame is None:
             self.stdscr.refresh()
 
     # Border glyphs picked per wall mode so the player can tell at a glance
@@ -215,19 +389,17 @@ class CursesUI:
         attr = self._attr(style["color"], bold=True)
         sw, ph = self.screen_w, self.play_h
         oy, ox = self.play_origin_y, self.play_origin_x
-        # Corners
-        self._safe_addstr(oy, ox, style["tl"], attr)
-        self._safe_addstr(oy, ox + sw + 1, style["tr"], attr)
-        self._safe_addstr(oy + ph + 1, ox, style["bl"], attr)
-        self._safe_addstr(oy + ph + 1, ox + sw + 1, style["br"], attr)
-        # Top + bottom edges
-        for c in range(1, sw + 1):
-            self._safe_addstr(oy, ox + c, style["h"], attr)
-            self._safe_addstr(oy + ph + 1, ox + c, style["h"], attr)
+        # Top + bottom edges, corners included, as one string each
+        edge = style["h"] * sw
+        self._safe_addstr(oy, ox, style["tl"] + edge + style["tr"], attr)
+        self._safe_addstr(oy + ph + 1, ox, style["bl"] + edge + style["br"],
+                          attr)
         # Side edges
-        for r in range(1, ph + 1):
-            self._safe_addstr(oy + r, ox, style["v"], attr)
-            self._safe_addstr(oy + r, ox + sw + 1, style["v"], attr)
+        v = style["v"]
+        addstr = self._safe_addstr
+        for r in range(oy + 1, oy + ph + 1):
+            addstr(r, ox, v, attr)
+            addstr(r, ox + sw + 1, v, attr)
 
     def _cell_to_screen(self, pos: Tuple[int, int]) -> Tuple[int, int]:
         """Convert a (row, col) playfield cell to absolute screen coords,
@@ -236,13 +408,31 @@ class CursesUI:
         return (self.play_origin_y + 1 + pos[0],
                 self.play_origin_x + 1 + pos[1] * 2)
 
-    def draw_snake(self, body: List[Tuple[int, int]], direction: Optional[Direction] = None) -> None:
-        if not self.stdscr or not body:
+    def draw_snake(self, body: Iterable[Tuple[int, int]], direction: Optional[Direction] = None) -> None:
+        if not self.stdscr:
             return
         attr_segment = self._attr(COLOR_SNAKE, bold=True)
-        for segment in body:
-            r, c = self._cell_to_screen(segment)
-            self._safe_addstr(r, c, SNAKE_SEGMENT, attr_segment)
+        # Coalesce horizontally adjacent segments into one string per run,
+        # so a straight stretch of snake is a single addstr, not one per
+        # cell. Each cell is SNAKE_SEGMENT wide on screen, so a run of n
+        # cells is just the glyph repeated n times.
+        by_row: Dict[int, List[int]] = {}
+        for r, c in body:
+            by_row.setdefault(r, []).append(c)
+        top = self.play_origin_y + 1
+        left = self.play_origin_x + 1
+        addstr = self._safe_addstr
+        for r, cols in by_row.items():
+            cols.sort()
+            start = prev = cols[0]
+            for c in cols:
+                if c > prev + 1:
+                    addstr(top + r, left + start * 2,
+                           SNAKE_SEGMENT * (prev - start + 1), attr_segment)
+                    start = c
+                prev = c
+            addstr(top + r, left + start * 2,
+                   SNAKE_SEGMENT * (prev - start + 1), attr_segment)
 
     def draw_food(self, pos: Tuple[int, int], char: str = FOOD_CHAR,
                   color: int = COLOR_FOOD) -> None:
@@ -306,16 +496,23 @@ class CursesUI:
         row = self.canvas_h_cells + 2
         w = self.win_w
 
-        # Line 1 — score & state
-        mode_badge = "WRAP" if wall_mode == WallMode.WRAP else "CLASSIC"
-        stats = (f" Score: {score}  │  Hi: {high_score}  │  "
-                 f"Lvl: {level}  │  Mode: {mode_badge}")
-        if buff_label:
-            stats += f"  │  ⚡ {buff_label} {buff_remaining:.1f}s"
-        if paused:
-            stats += "  │  ⏸ PAUSED"
-        stats_line = stats.center(w)
-        self._safe_addstr(row, 0, stats_line[:w],
+        # Line 1 — score & state. Rebuilt only when one of its inputs
+        # changes; between eats it's the same string frame after frame. The
+        # buff timer is keyed as displayed — the raw float moves every frame.
+        buff_text = f"{buff_remaining:.1f}" if buff_label else ""
+        stats_key = (score, high_score, level, paused, wall_mode, w,
+                     buff_label, buff_text)
+        if stats_key != self._stats_key:
+            mode_badge = "WRAP" if wall_mode == WallMode.WRAP else "CLASSIC"
+            stats = (f" Score: {score}  │  Hi: {high_score}  │  "
+                     f"Lvl: {level}  │  Mode: {mode_badge}")
+            if buff_label:
+                stats += f"  │  ⚡ {buff_label} {buff_text}s"
+            if paused:
+                stats += "  │  ⏸ PAUSED"
+            self._stats_key = stats_key
+            self._stats_line = stats.center(w)[:w]
+        self._safe_addstr(row, 0, self._stats_line,
                           self._attr(COLOR_HUD, bold=True))
 
         # Line 2 — what's on the field. We render the fruit info as plain text
@@ -347,10 +544,9 @@ class CursesUI:
                                   self._attr(powerup_color, bold=True)
                                   | curses.A_BLINK)
 
-        # Line 3 — hints
-        hints = GAME_HINTS.strip()
-        hints_line = hints.center(w)
-        self._safe_addstr(row + 2, 0, hints_line[:w], self._attr(COLOR_BORDER))
+        # Line 3 — hints (constant text, centered once per width)
+        self._safe_addstr(row + 2, 0, _center_line(GAME_HINTS.strip(), w),
+                          self._attr(COLOR_BORDER))
 
     # -- screens -------------------------------------------------------------
 
@@ -359,62 +555,10 @@ class CursesUI:
         if not self.stdscr:
             return
         self.clear()
-
-        # Calculate widths for the menu box
-        max_item_len = max(len(MENU_MARKER + item) for item in items)
-        box_inner = max_item_len + 2  # padding inside box
-        box_w = box_inner + 2  # +2 for borders
-
-        # Calculate total content height for vertical centering
-        logo_lines = len(GAME_TITLE)
-        # box: top border + items (1 row each) + bottom border
-        box_h = len(items) + 2
-        total_h = logo_lines + 2 + box_h + 2  # +gaps
-        start_row = max(1, (self.win_h - total_h) // 2)
-
-        # ASCII art title - center each line
-        for i, line in enumerate(GAME_TITLE):
-            self._safe_addstr(start_row + i, self._center_col(line), line,
-                              self._attr(COLOR_SNAKE, bold=True))
-
-        # Menu box
-        menu_start = start_row + logo_lines + 2
-        box_col = self._center_col("x" * box_w)
-
-        # Top border
-        top = "╔" + "═" * box_inner + "╗"
-        self._safe_addstr(menu_start, box_col, top, self._attr(COLOR_BORDER))
-
-        # Items
-        for i, item in enumerate(items):
-            marker = MENU_MARKER if i == selected else MENU_SPACER
-            label = f"{marker}{item}"
-            padded = label.ljust(box_inner)
-            row = menu_start + 1 + i
-            if i == selected:
-                attr = self._attr(COLOR_HIGHLIGHT, bold=True)
-            else:
-                attr = self._attr(COLOR_TITLE)
-            self._safe_addstr(row, box_col, "║", self._attr(COLOR_BORDER))
-            self._safe_addstr(row, box_col + 1, padded, attr)
-            self._safe_addstr(row, box_col + 1 + box_inner, "║",
-                              self._attr(COLOR_BORDER))
-
-        # Bottom border
-        bot = "╚" + "═" * box_inner + "╝"
-        self._safe_addstr(menu_start + 1 + len(items), box_col, bot,
-                          self._attr(COLOR_BORDER))
-
-        # High score below box
-        if high_score > 0:
-            hs = f"★ Best: {high_score} ★"
-            hs_row = menu_start + box_h + 1
-            self._safe_addstr(hs_row, self._center_col(hs), hs,
-                              self._attr(COLOR_HUD, bold=True))
-
-        # Hint at bottom
-        self._safe_addstr(self.win_h - 1, self._center_col(MENU_HINT),
-                          MENU_HINT, self._attr(COLOR_BORDER))
+        layout = _menu_layout(tuple(items), selected, high_score,
+                              self.win_w, self.win_h)
+        for row, col, text, pair, bold in layout:
+            self._safe_addstr(row, col, text, self._attr(pair, bold=bold))
         self.refresh()
 
     def show_high_scores(self,
@@ -477,21 +621,8 @@ class CursesUI:
         if not self.stdscr:
             return
         self.clear()
-        title = "╔═══════════════════╗"
-        title2 = "║    ? CONTROLS ?   ║"
-        title3 = "╚═══════════════════╝"
-        self._safe_addstr(2, self._center_col(title), title,
-                          self._attr(COLOR_HUD, bold=True))
-        self._safe_addstr(3, self._center_col(title2), title2,
-                          self._attr(COLOR_HUD, bold=True))
-        self._safe_addstr(4, self._center_col(title3), title3,
-                          self._attr(COLOR_HUD, bold=True))
-        start = 6
-        for i, line in enumerate(HELP_TEXT):
-            attr = self._attr(COLOR_SNAKE) if line.startswith(("Arrow", "P ", "R ", "M ", "Q ")) else self._attr(COLOR_TITLE)
-            self._safe_addstr(start + i, self._center_col(line), line, attr)
-        self._safe_addstr(self.win_h - 1, self._center_col(RETURN_HINT),
-                          RETURN_HINT, self._attr(COLOR_BORDER))
+        for row, col, text, pair, bold in _help_layout(self.win_w, self.win_h):
+            self._safe_addstr(row, col, text, self._attr(pair, bold=bold))
         self.refresh()
 
     def show_game_over(self, score: int, high_score: int,
@@ -550,7 +681,7 @@ class CursesUI:
             self._safe_addstr(mid_r + i, self._center_col(text), text, attr)
         self.refresh()
 
-    def show_enter_initials(self, score: int, initials: List[str], 
+    def show_enter_initials(self, score: int, initials: str,
                             cursor: int) -> None:
         """Show initials entry screen."""
         if not self.stdscr:
@@ -653,7 +784,7 @@ class CursesUI:
 
     # -- full play-frame render ----------------------------------------------
 
-    def render_frame(self, snake_body: List[Tuple[int, int]],
+    def render_frame(self, snake_body: Iterable[Tuple[int, int]],
                      food_pos: Tuple[int, int], score: int,
                      high_score: int, level: int,
                      paused: bool = False,
@@ -673,26 +804,52 @@ class CursesUI:
                      buff_label: str = "",
                      buff_remaining: float = 0.0,
                      wall_mode: WallMode = WallMode.WRAP) -> None:
-        """Render one complete game frame (border + objects + HUD)."""
-        self.clear()
-        self.draw_border(wall_mode=wall_mode)
-        self.draw_snake(snake_body, snake_direction)
-        self.draw_food(food_pos, food_char, color=food_color)
-        self.draw_bonus_food(bonus_pos, bonus_char, bonus_blink,
-                             color=bonus_color)
-        if popups:
-            self.draw_popups(popups)
-        self.draw_hud(
-            score, high_score, level, paused,
-            buff_label=buff_label, buff_remaining=buff_remaining,
-            wall_mode=wall_mode,
-            fruit_char=food_char, fruit_name=food_name,
-            fruit_points=food_points, fruit_color=food_color,
-            powerup_char=bonus_char if bonus_pos else "",
-            powerup_name=bonus_name if bonus_pos else "",
-            powerup_points=bonus_points, powerup_remaining=bonus_remaining,
-            powerup_color=bonus_color,
-        )
-        if paused:
-            self.show_paused()
-        self.refresh()
+        """Render one complete game frame (border + objects + HUD).
+
+        The frame is drawn into a row buffer first and only rows that differ
+        from the previous frame reach the terminal — between ticks that's
+        the head, tail and fruit rows plus the HUD, not the whole field.
+        """
+        if not self.stdscr:
+            return
+        if self._last_frame is None:
+            self.clear()
+        self._frame = {}
+        try:
+            self.draw_border(wall_mode=wall_mode)
+            self.draw_snake(snake_body, snake_direction)
+            self.draw_food(food_pos, food_char, color=food_color)
+            self.draw_bonus_food(bonus_pos, bonus_char, bonus_blink,
+                                 color=bonus_color)
+            if popups:
+                self.draw_popups(popups)
+            self.draw_hud(
+                score, high_score, level, paused,
+                buff_label=buff_label, buff_remaining=buff_remaining,
+                wall_mode=wall_mode,
+                fruit_char=food_char, fruit_name=food_name,
+                fruit_points=food_points, fruit_color=food_color,
+                powerup_char=bonus_char if bonus_pos else "",
+                powerup_name=bonus_name if bonus_pos else "",
+                powerup_points=bonus_points, powerup_remaining=bonus_remaining,
+                powerup_color=bonus_color,
+            )
+            if paused:
+                self.show_paused()
+            frame = self._frame
+        finally:
+            self._frame = None
+        last = self._last_frame
+        dirty = False
+        for row, writes in frame.items():
+            if last.get(row) != writes:
+                self._paint_row(row, writes)
+                dirty = True
+        for row in last.keys() - frame.keys():
+            self._paint_row(row, [])
+            dirty = True
+        self._last_frame = frame
+        # Nothing changed (e.g. a key press that didn't move the snake):
+        # skip the terminal update entirely.
+        if dirty:
+            self.refresh()
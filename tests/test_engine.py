@@ -2,13 +2,16 @@
 
 import json
 import os
+import threading
+
+import pytest
 
 from snakeclaw.engine import GameEngine, HighScoreManager, HighScoreEntry, SPEED_LEVELS, POINTS_PER_LEVEL
 from snakeclaw.constants import (CLASSIC_HEIGHT, CLASSIC_WIDTH, MODERN_HEIGHT,
                                   MODERN_WIDTH, NEAR_MISS_THRESHOLD,
                                   REGULAR_FRUITS)
 from snakeclaw.model import (Action, Direction, Effect, FruitKind, GameMode,
-                             GameState, WallMode)
+                             GameState, Snake, WallMode)
 
 # Single-point apple kind so eating-related tests can assert on exact scores.
 APPLE = next(k for k in REGULAR_FRUITS if k.points == 1)
@@ -42,6 +45,16 @@ class TestHighScoreManager:
         assert mgr2.best == 30
         assert len(mgr2.get_top()) == 3
 
+    def test_persist_without_orjson(self, tmp_path, monkeypatch):
+        # The stdlib json fallback must read/write the same file format.
+        monkeypatch.setattr("snakeclaw.engine.orjson", None)
+        p = _tmp_path(tmp_path)
+        HighScoreManager(path=p).add(12, "ABC")
+        HighScoreManager._cache.pop(p, None)  # force a real parse
+        mgr2 = HighScoreManager(path=p)
+        assert mgr2.best == 12
+        assert mgr2.get_top()[0].initials == "ABC"
+
     def test_max_entries(self, tmp_path):
         mgr = HighScoreManager(path=_tmp_path(tmp_path), max_entries=3)
         for i in range(5):
@@ -49,6 +62,15 @@ class TestHighScoreManager:
         assert len(mgr.get_top()) == 3
         assert mgr.get_top()[0].score == 40
 
+    def test_ties_rank_in_arrival_order(self, tmp_path):
+        # An equal score doesn't displace an earlier one; it ranks below.
+        mgr = HighScoreManager(path=_tmp_path(tmp_path), max_entries=3)
+        mgr.add(20, "AAA"); mgr.add(30, "BBB"); mgr.add(20, "CCC")
+        assert [e.initials for e in mgr.get_top()] == ["BBB", "AAA", "CCC"]
+        mgr.add(25, "DDD")
+        assert [e.initials for e in mgr.get_top()] == ["BBB", "DDD", "AAA"]
+        assert not mgr.is_high_score(20)
+
     def test_is_high_score_empty(self, tmp_path):
         mgr = HighScoreManager(path=_tmp_path(tmp_path))
         assert mgr.is_high_score(1)
@@ -88,8 +110,10 @@ class TestHighScoreManager:
         p = _tmp_path(tmp_path)
         mgr = HighScoreManager(path=p, max_entries=2)
         mgr.add(50, "AAA"); mgr.add(40, "BBB")
+        mgr.flush()
         mtime_before = os.path.getmtime(p)
         mgr.add(10, "CCC")  # below the cut
+        mgr.flush()
         assert [e.score for e in mgr.get_top()] == [50, 40]
         assert os.path.getmtime(p) == mtime_before  # no rewrite
 
@@ -102,16 +126,113 @@ class TestHighScoreManager:
         p = _tmp_path(tmp_path)
         mgr = HighScoreManager(path=p)
         mgr.add(100, "AAA")
+        mgr.flush()
         # The temp sentinel must not linger after a successful save.
         assert not os.path.exists(p + ".tmp")
 
+    def test_add_saves_in_background(self, tmp_path):
+        # add() only queues the write; flush() waits for it to hit disk.
+        p = _tmp_path(tmp_path)
+        mgr = HighScoreManager(path=p)
+        mgr.add(7, "BGW")
+        mgr.flush()
+        with open(p) as f:
+            assert json.load(f)[0]["initials"] == "BGW"
+
+    def test_burst_of_adds_coalesces_into_one_write(self, tmp_path,
+                                                    monkeypatch):
+        p = _tmp_path(tmp_path)
+        mgr = HighScoreManager(path=p, max_entries=5)
+        writes = []
+        real_write = HighScoreManager._write
+
+        def counting_write(path, entries):
+            writes.append(len(entries))
+            real_write(path, entries)
+        monkeypatch.setattr(HighScoreManager, "_write",
+                            staticmethod(counting_write))
+        # Hold the writer thread so every add() below finds its save queued.
+        gate = threading.Event()
+        HighScoreManager._writer.submit(gate.wait)
+        try:
+            for s in range(1, 21):
+                mgr.add(s, "BRS")
+        finally:
+            # The writer is shared: never leave it blocked for later tests.
+            gate.set()
+        mgr.flush()
+        assert writes == [5]
+        with open(p) as f:
+            assert [e["score"] for e in json.load(f)] == [20, 19, 18, 17, 16]
+
+    def test_save_waits_for_queued_write(self, tmp_path):
+        # A sync save after a queued one must be serialized behind it, so the
+        # newer table wins on disk and no temp file is left behind.
+        p = _tmp_path(tmp_path)
+        mgr = HighScoreManager(path=p)
+        mgr.add(5, "OLD")
+        mgr.add(9, "NEW")
+        mgr.save()
+        with open(p) as f:
+            assert [e["initials"] for e in json.load(f)] == ["NEW", "OLD"]
+        assert not os.path.exists(p + ".tmp")
+
+    def test_flush_reraises_failed_write(self, tmp_path, monkeypatch):
+        mgr = HighScoreManager(path=_tmp_path(tmp_path))
+
+        def fail(*_a):
+            raise OSError("disk full")
+        monkeypatch.setattr(HighScoreManager, "_write", staticmethod(fail))
+        mgr.add(3, "ERR")
+        with pytest.raises(OSError):
+            mgr.flush()
+
+    def test_flush_does_not_take_another_managers_save(self, tmp_path,
+                                                       monkeypatch):
+        p = _tmp_path(tmp_path)
+        first = HighScoreManager(path=p)
+        second = HighScoreManager(path=p)
+
+        def fail(*_a):
+            raise OSError("disk full")
+        monkeypatch.setattr(HighScoreManager, "_write", staticmethod(fail))
+        first.add(3, "ONE")
+        second.add(4, "TWO")
+        with pytest.raises(OSError):
+            second.flush()
+        with pytest.raises(OSError):
+            first.flush()
+
+    def test_reload_unchanged_file_skips_parse(self, tmp_path, monkeypatch):
+        p = _tmp_path(tmp_path)
+        HighScoreManager(path=p).add(33, "CCH")
+        HighScoreManager(path=p)  # waits for the save, then parses once
+
+        def boom(*_a, **_k):
+            raise AssertionError("unchanged file was re-parsed")
+        monkeypatch.setattr("snakeclaw.engine.json.loads", boom)
+        monkeypatch.setattr("snakeclaw.engine.orjson", None)
+        mgr = HighScoreManager(path=p)
+        assert mgr.best == 33
+        assert mgr.get_top()[0].initials == "CCH"
+
+    def test_reload_sees_external_rewrite(self, tmp_path):
+        p = _tmp_path(tmp_path)
+        HighScoreManager(path=p).add(10, "OLD")
+        HighScoreManager(path=p)
+        with open(p, "w") as f:
+            json.dump([{"score": 99, "timestamp": 1.0, "initials": "NEW",
+                        "padding": "changes the size too"}], f)
+        mgr = HighScoreManager(path=p)
+        assert mgr.best == 99
+
 
 # ── GameEngine state transitions ──────────────────────────────────────────
 
 class TestEngineMenu:
     def test_starts_in_menu(self):
         e = GameEngine()
-        assert e.state == GameState.MENU
+        assert e.state is GameState.MENU
 
     def test_menu_navigate_down(self):
         e = GameEngine()
@@ -127,20 +248,20 @@ class TestEngineMenu:
     def test_menu_start_game(self):
         e = GameEngine()
         e.handle_input(Action.SELECT)  # "Start Game" is index 0
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
 
     def test_menu_high_scores(self):
         # Menu order: Start, Classic, [High Scores], Help, Quit
         e = GameEngine()
         e.menu_index = 2
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.HIGH_SCORES
+        assert e.state is GameState.HIGH_SCORES
 
     def test_menu_help(self):
         e = GameEngine()
         e.menu_index = 3
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.HELP
+        assert e.state is GameState.HELP
 
     def test_menu_quit_goes_through_confirm(self):
         # Selecting "Quit" from the menu must also ask for confirmation —
@@ -148,23 +269,23 @@ class TestEngineMenu:
         e = GameEngine()
         e.menu_index = 4
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.CONFIRM_QUIT
+        assert e.state is GameState.CONFIRM_QUIT
         e.handle_input(Action.YES)
-        assert e.state == GameState.QUIT
+        assert e.state is GameState.QUIT
 
     def test_menu_start_uses_wrap_walls(self, tmp_path):
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
         e.menu_index = 0  # Start Game
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.PLAYING
-        assert e.wall_mode == WallMode.WRAP
+        assert e.state is GameState.PLAYING
+        assert e.wall_mode is WallMode.WRAP
 
     def test_menu_classic_uses_solid_walls(self, tmp_path):
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
         e.menu_index = 1  # Classic Game
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.PLAYING
-        assert e.wall_mode == WallMode.SOLID
+        assert e.state is GameState.PLAYING
+        assert e.wall_mode is WallMode.SOLID
 
     def test_menu_labels(self):
         e = GameEngine()
@@ -190,20 +311,20 @@ class TestEngineMenu:
         # verifies the default-selected button is "Stay" (index 0).
         e = GameEngine()
         e.handle_input(Action.QUIT)
-        assert e.state == GameState.CONFIRM_QUIT
+        assert e.state is GameState.CONFIRM_QUIT
         assert e.confirm_quit_index == 0
 
     def test_menu_q_then_yes_quits(self):
         e = GameEngine()
         e.handle_input(Action.QUIT)
         e.handle_input(Action.YES)
-        assert e.state == GameState.QUIT
+        assert e.state is GameState.QUIT
 
     def test_menu_q_then_no_returns_to_menu(self):
         e = GameEngine()
         e.handle_input(Action.QUIT)
         e.handle_input(Action.NO)
-        assert e.state == GameState.MENU
+        assert e.state is GameState.MENU
 
 
 def _playing(tmp_path, wall_mode=WallMode.WRAP):
@@ -216,11 +337,19 @@ def _playing(tmp_path, wall_mode=WallMode.WRAP):
     return e
 
 
+def _feed_once(e):
+    """Drop a 1-point apple right in front of the head and tick onto it."""
+    head = e.snake.get_head()
+    d = e.snake.direction.value
+    e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
+    e.tick()
+
+
 class TestEnginePlaying:
 
     def test_new_game_state(self, tmp_path):
         e = _playing(tmp_path)
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
         assert e.score == 0
         assert e.level == 1
         assert e.snake is not None
@@ -229,32 +358,32 @@ class TestEnginePlaying:
     def test_direction_change(self, tmp_path):
         e = _playing(tmp_path)
         e.handle_input(Direction.DOWN)
-        assert e.snake.direction == Direction.DOWN
+        assert e.snake.direction is Direction.DOWN
 
     def test_pause(self, tmp_path):
         e = _playing(tmp_path)
         e.handle_input(Action.PAUSE)
-        assert e.state == GameState.PAUSED
+        assert e.state is GameState.PAUSED
 
     def test_quit_while_playing_asks_confirm(self, tmp_path):
         # Quitting mid-game must now go through the confirm overlay. The
         # original state is preserved so cancel returns the player to play.
         e = _playing(tmp_path)
         e.handle_input(Action.QUIT)
-        assert e.state == GameState.CONFIRM_QUIT
-        assert e._pre_quit_state == GameState.PLAYING
+        assert e.state is GameState.CONFIRM_QUIT
+        assert e._pre_quit_state is GameState.PLAYING
 
     def test_quit_confirm_cancel_resumes_play(self, tmp_path):
         e = _playing(tmp_path)
         e.handle_input(Action.QUIT)
         e.handle_input(Action.NO)
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
 
     def test_quit_confirm_yes_actually_quits(self, tmp_path):
         e = _playing(tmp_path)
         e.handle_input(Action.QUIT)
         e.handle_input(Action.YES)
-        assert e.state == GameState.QUIT
+        assert e.state is GameState.QUIT
 
     def test_quit_confirm_arrow_select_quit(self, tmp_path):
         # Arrow keys + Enter is the menu-driven path: ←/→ toggles between
@@ -264,7 +393,7 @@ class TestEnginePlaying:
         e.handle_input(Direction.RIGHT)
         assert e.confirm_quit_index == 1
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.QUIT
+        assert e.state is GameState.QUIT
 
     def test_tick_moves_snake(self, tmp_path):
         e = _playing(tmp_path)
@@ -281,34 +410,25 @@ class TestEnginePlaying:
 
     def test_eat_food_scores(self, tmp_path):
         e = _playing(tmp_path)
-        head = e.snake.get_head()
-        d = e.snake.direction.value
-        next_pos = (head[0] + d[0], head[1] + d[1])
-        # Pin to apple (1pt) so the assertion is deterministic; in normal play
-        # the kind is weighted-random and would score 1–3.
-        e.food.place(pos=next_pos, kind=APPLE)
-        e.tick()
+        # Feed an apple (1pt) so the assertion is deterministic; in normal
+        # play the kind is weighted-random and would score 1–3.
+        _feed_once(e)
         assert e.score == 1
 
     def test_eat_food_grows_snake(self, tmp_path):
         e = _playing(tmp_path)
         initial_len = len(e.snake.get_body())
-        head = e.snake.get_head()
-        d = e.snake.direction.value
-        e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
-        e.tick()
+        _feed_once(e)
         assert len(e.snake.get_body()) == initial_len + 1
 
     def test_wall_collision_game_over(self, tmp_path):
-        # Solid mode: walls are deadly. Pin food off the snake's rightward
-        # path so it dies hitting the wall rather than scoring.
+        # Solid mode: walls are deadly. Put the head on the top edge facing
+        # up, with food out of the way, so the very next tick hits the wall.
         e = _playing(tmp_path, wall_mode=WallMode.SOLID)
-        e.food.place(pos=(0, 0))
-        for _ in range(100):
-            e.tick()
-            if e.state == GameState.GAME_OVER:
-                break
-        assert e.state == GameState.GAME_OVER
+        e.snake = Snake((0, 5), length=3, direction=Direction.UP)
+        e.food.place(pos=(e.height - 1, 0))
+        e.tick()
+        assert e.state is GameState.GAME_OVER
 
     def test_wrap_mode_passes_through_wall(self, tmp_path):
         # Default WRAP mode: snake survives wall contact and re-enters opposite.
@@ -316,38 +436,32 @@ class TestEnginePlaying:
         # Park snake just before the right wall, body trailing left.
         e.snake.body = [(5, e.width - 1), (5, e.width - 2), (5, e.width - 3)]
         e.snake.direction = Direction.RIGHT
-        e.snake._last_moved_direction = Direction.RIGHT
+        e.snake._last_step = Direction.RIGHT.value
         # Pin food away so eating doesn't change state.
         e.food.place(pos=(0, 0))
         e.tick()
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
         assert e.snake.get_head() == (5, 0)  # wrapped to opposite side
 
     def test_level_increases(self, tmp_path):
         e = _playing(tmp_path)
         for i in range(POINTS_PER_LEVEL):
-            head = e.snake.get_head()
-            d = e.snake.direction.value
-            e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
-            e.tick()
+            _feed_once(e)
         assert e.level == 2
 
     def test_self_collision_game_over(self, tmp_path):
         e = _playing(tmp_path)
         # Grow snake then turn into itself
         for i in range(6):
-            head = e.snake.get_head()
-            d = e.snake.direction.value
-            e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
-            e.tick()
+            _feed_once(e)
         e.handle_input(Direction.DOWN); e.tick()
         e.handle_input(Direction.LEFT); e.tick()
         e.handle_input(Direction.UP); e.tick()
         # Should be in ENTER_INITIALS state since we have a score
-        assert e.state == GameState.ENTER_INITIALS
+        assert e.state is GameState.ENTER_INITIALS
         # Confirm initials to proceed to GAME_OVER
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.GAME_OVER
+        assert e.state is GameState.GAME_OVER
 
 
 class TestEnginePaused:
@@ -355,9 +469,9 @@ class TestEnginePaused:
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
         e.new_game()
         e.handle_input(Action.PAUSE)
-        assert e.state == GameState.PAUSED
+        assert e.state is GameState.PAUSED
         e.handle_input(Action.PAUSE)
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
 
     def test_quit_while_paused(self, tmp_path):
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
@@ -365,7 +479,7 @@ class TestEnginePaused:
         e.handle_input(Action.PAUSE)
         e.handle_input(Action.QUIT)
         e.handle_input(Action.YES)  # confirm
-        assert e.state == GameState.QUIT
+        assert e.state is GameState.QUIT
 
     def test_reset_while_paused(self, tmp_path):
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
@@ -373,7 +487,7 @@ class TestEnginePaused:
         e.score = 5
         e.handle_input(Action.PAUSE)
         e.handle_input(Action.RESET)
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
         assert e.score == 0
 
 
@@ -383,14 +497,14 @@ class TestEngineGameOver:
         e.new_game()
         e.state = GameState.GAME_OVER
         e.handle_input(Action.RESET)
-        assert e.state == GameState.PLAYING
+        assert e.state is GameState.PLAYING
 
     def test_back_to_menu(self, tmp_path):
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
         e.new_game()
         e.state = GameState.GAME_OVER
         e.handle_input(Action.MENU)
-        assert e.state == GameState.MENU
+        assert e.state is GameState.MENU
 
     def test_quit(self, tmp_path):
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
@@ -398,26 +512,24 @@ class TestEngineGameOver:
         e.state = GameState.GAME_OVER
         e.handle_input(Action.QUIT)
         e.handle_input(Action.YES)  # confirm
-        assert e.state == GameState.QUIT
+        assert e.state is GameState.QUIT
 
     def test_score_saved_on_game_over(self, tmp_path):
-        # Solid mode so the snake reliably dies on the wall within 100 ticks.
+        # Solid mode so steering into the top edge ends the game.
         e = GameEngine(highscore_path=str(tmp_path / "hs.json"))
         e.new_game()
         e.wall_mode = WallMode.SOLID
         # Feed snake to get score (apple is 1 pt)
-        head = e.snake.get_head()
-        d = e.snake.direction.value
-        e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
-        e.tick()
+        _feed_once(e)
         assert e.score == 1
-        # Force game over
-        for _ in range(100):
-            e.tick()
-            if e.state in (GameState.GAME_OVER, GameState.ENTER_INITIALS):
-                break
+        # Force game over: head on the top edge facing the wall.
+        e.snake = Snake((0, e.snake.get_head()[1]), length=3,
+                        direction=Direction.UP)
+        e.food.place(pos=(e.height - 1, 0))
+        e.tick()
+        assert e.state in (GameState.GAME_OVER, GameState.ENTER_INITIALS)
         # If we're in ENTER_INITIALS, confirm to save the score
-        if e.state == GameState.ENTER_INITIALS:
+        if e.state is GameState.ENTER_INITIALS:
             e.handle_input(Action.SELECT)
         assert e.high_scores.best >= 1
 
@@ -427,13 +539,13 @@ class TestEngineOverlays:
         e = GameEngine()
         e.state = GameState.HIGH_SCORES
         e.handle_input(Action.SELECT)
-        assert e.state == GameState.MENU
+        assert e.state is GameState.MENU
 
     def test_help_returns_to_menu(self):
         e = GameEngine()
         e.state = GameState.HELP
         e.handle_input(Direction.UP)  # any input
-        assert e.state == GameState.MENU
+        assert e.state is GameState.MENU
 
 
 class TestEngineFoodReachability:
@@ -498,7 +610,7 @@ class TestEngineGameModes:
         e.new_game(GameMode.CLASSIC)
         assert e.width == CLASSIC_WIDTH
         assert e.height == CLASSIC_HEIGHT
-        assert e.wall_mode == WallMode.SOLID
+        assert e.wall_mode is WallMode.SOLID
         assert e.power_up is None  # no power-ups in classic
         # Classic fruit is apples-only; eating must always score exactly 1.
         head = e.snake.get_head()
@@ -512,7 +624,7 @@ class TestEngineGameModes:
         e.new_game(GameMode.MODERN)
         assert e.width == MODERN_WIDTH
         assert e.height == MODERN_HEIGHT
-        assert e.wall_mode == WallMode.WRAP
+        assert e.wall_mode is WallMode.WRAP
         assert e.power_up is not None
 
     def test_classic_suppresses_popups(self, tmp_path):
@@ -634,10 +746,7 @@ class TestEngineEffectsAndPopups:
         e = _playing(tmp_path)
         # Grow first so there's enough body to shrink (start length=3).
         for _ in range(4):
-            head = e.snake.get_head()
-            d = e.snake.direction.value
-            e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
-            e.tick()
+            _feed_once(e)
         before = len(e.snake.body)
         self._eat_powerup(e, self._kind("shrink"))
         # Eating grows by 1, then shrink removes SHRINK_AMOUNT (=2), so net -1.
@@ -646,10 +755,7 @@ class TestEngineEffectsAndPopups:
 
     def test_eating_creates_popup(self, tmp_path):
         e = _playing(tmp_path)
-        head = e.snake.get_head()
-        d = e.snake.direction.value
-        e.food.place(pos=(head[0] + d[0], head[1] + d[1]), kind=APPLE)
-        e.tick()
+        _feed_once(e)
         assert len(e.popups) == 1
         assert e.popups[0].text == "+1"
 
@@ -665,6 +771,19 @@ class TestEngineEffectsAndPopups:
         assert e.speed_multiplier == 1.0
 
 
+class TestEngineInitials:
+    def test_cycle_wraps_through_blank(self):
+        # The ring is blank, A..Z: stepping down from A hits blank, then Z.
+        e = GameEngine()
+        e._cycle_initial(-1)
+        assert e.current_initials[:1] == b" "
+        e._cycle_initial(-1)
+        assert e.current_initials[:1] == b"Z"
+        e._cycle_initial(1)
+        e._cycle_initial(1)
+        assert e.current_initials[:1] == b"A"
+
+
 class TestEngineTickRate:
     def test_tick_rate_level_1(self):
         e = GameEngine()
@@ -1,6 +1,35 @@
 """Integration-level tests for SnakeGame (mocked UI)."""
 
-from snakeclaw.game import SnakeGame
+import time
+
+from snakeclaw.game import SnakeGame, _sleep_until
+from snakeclaw.model import Action, Direction, GameState
+
+
+class _ScriptedUI:
+    """Stand-in UI: get_input() replays `keys`, every draw call is a no-op.
+
+    Any wait_for_key() (e.g. the quit confirmation) ends the game loop.
+    """
+
+    def __init__(self, engine, keys):
+        self.engine = engine
+        self.keys = list(keys)
+        self.read_at = []
+
+    def get_input(self):
+        self.read_at.append(time.perf_counter_ns())
+        return self.keys.pop(0) if self.keys else None
+
+    def drain_input(self):
+        return []
+
+    def wait_for_key(self):
+        self.engine.state = GameState.QUIT
+        return None
+
+    def __getattr__(self, name):
+        return lambda *a, **k: None
 
 class TestSnakeGameInit:
     def test_creates_engine_and_ui(self):
@@ -9,3 +38,37 @@ class TestSnakeGameInit:
         assert g.engine.height == 20
         assert g.ui.play_w == 40
         assert g.ui.play_h == 20
+
+    def test_run_flushes_high_scores_after_stopping_ui(self, monkeypatch):
+        g = SnakeGame(width=40, height=20)
+        calls = []
+        monkeypatch.setattr(g.ui, "start", lambda: None)
+        monkeypatch.setattr(g.ui, "stop", lambda: calls.append("stop"))
+        monkeypatch.setattr(g, "_loop", lambda: None)
+        monkeypatch.setattr(g.engine, "flush_high_scores",
+                            lambda: calls.append("flush"))
+        g.run()
+        assert calls == ["stop", "flush"]
+
+
+class TestLoop:
+    def test_unmapped_key_does_not_wait_out_the_tick(self):
+        # get_input() returns None for an unmapped key too; the loop must go
+        # straight back to getch rather than sleep until the tick is due.
+        g = SnakeGame(width=40, height=20)
+        g.engine.new_game()
+        g.ui = ui = _ScriptedUI(g.engine, [None, Direction.DOWN, Action.QUIT])
+        g._loop()
+        assert ui.read_at[1] - ui.read_at[0] < 20_000_000  # 20 ms
+
+
+class TestSleepUntil:
+    def test_returns_at_or_after_deadline(self):
+        deadline = time.perf_counter_ns() + 10_000_000  # 10 ms
+        _sleep_until(deadline)
+        assert time.perf_counter_ns() >= deadline
+
+    def test_past_deadline_returns_immediately(self):
+        start = time.perf_counter_ns()
+        _sleep_until(start - 1_000_000_000)
+        assert time.perf_counter_ns() - start < 50_000_000
@@ -33,10 +33,10 @@ class TestDirection:
         assert Direction.RIGHT.value == (0, 1)
 
     def test_opposite_map(self):
-        assert OPPOSITE[Direction.UP] == Direction.DOWN
-        assert OPPOSITE[Direction.DOWN] == Direction.UP
-        assert OPPOSITE[Direction.LEFT] == Direction.RIGHT
-        assert OPPOSITE[Direction.RIGHT] == Direction.LEFT
+        assert OPPOSITE[Direction.UP] is Direction.DOWN
+        assert OPPOSITE[Direction.DOWN] is Direction.UP
+        assert OPPOSITE[Direction.LEFT] is Direction.RIGHT
+        assert OPPOSITE[Direction.RIGHT] is Direction.LEFT
 
 
 class TestGameState:
@@ -97,27 +97,13 @@ class TestSnakeDirection:
     def test_set_valid_direction(self):
         s = Snake((5, 5), direction=Direction.RIGHT)
         s.set_direction(Direction.UP)
-        assert s.direction == Direction.UP
+        assert s.direction is Direction.UP
 
-    def test_reject_180_right_left(self):
-        s = Snake((5, 5), direction=Direction.RIGHT)
-        s.set_direction(Direction.LEFT)
-        assert s.direction == Direction.RIGHT
-
-    def test_reject_180_up_down(self):
-        s = Snake((5, 5), direction=Direction.UP)
-        s.set_direction(Direction.DOWN)
-        assert s.direction == Direction.UP
-
-    def test_reject_180_down_up(self):
-        s = Snake((5, 5), direction=Direction.DOWN)
-        s.set_direction(Direction.UP)
-        assert s.direction == Direction.DOWN
-
-    def test_reject_180_left_right(self):
-        s = Snake((5, 5), direction=Direction.LEFT)
-        s.set_direction(Direction.RIGHT)
-        assert s.direction == Direction.LEFT
+    @pytest.mark.parametrize("direction", list(Direction))
+    def test_reject_180(self, direction):
+        s = Snake((5, 5), direction=direction)
+        s.set_direction(OPPOSITE[direction])
+        assert s.direction is direction
 
     def test_reject_180_via_double_input_in_one_tick(self):
         # Snake going RIGHT. Two perpendicular inputs queued before the next move
@@ -126,7 +112,18 @@ class TestSnakeDirection:
         s = Snake((5, 5), direction=Direction.RIGHT)
         s.set_direction(Direction.UP)
         s.set_direction(Direction.LEFT)
-        assert s.direction == Direction.UP
+        assert s.direction is Direction.UP
+
+    @pytest.mark.parametrize("keys,expected", [
+        ((Direction.UP, Direction.RIGHT), Direction.RIGHT),
+        ((Direction.UP, Direction.DOWN), Direction.DOWN),
+    ])
+    def test_last_valid_key_in_tick_wins(self, keys, expected):
+        # Changing your mind within a tick replaces the pending turn.
+        s = Snake((5, 5), direction=Direction.RIGHT)
+        for d in keys:
+            s.set_direction(d)
+        assert s.direction is expected
 
 
 class TestSnakeCollision:
@@ -160,6 +157,22 @@ class TestSnakeCollision:
         s.body = [(5, 5), (5, 6), (5, 7), (6, 7), (6, 6), (6, 5), (5, 5)]
         assert s.check_collision(20, 20)
 
+    def test_self_collision_after_move(self):
+        # Drive the head into its own body with move(); the overlap is
+        # detected from the move itself, not from a rescan.
+        s = Snake((5, 5), length=5, direction=Direction.RIGHT)
+        s.move(new_head=(5, 3))  # (5, 3) is a body segment
+        assert s.check_collision(20, 20)
+        assert not Snake((5, 5), length=5).check_collision(20, 20)
+
+    @pytest.mark.parametrize("pos,out", [
+        ((0, 0), False), ((19, 9), False),
+        ((-1, 0), True), ((0, -1), True), ((-1, -1), True),
+        ((20, 0), True), ((0, 10), True),
+    ])
+    def test_out_of_bounds_edges(self, pos, out):
+        assert Snake._out_of_bounds(pos, width=10, height=20) is out
+
     def test_check_next_move_wall(self):
         s = Snake((5, 19), direction=Direction.RIGHT)
         assert s.check_next_move(20, 20)
@@ -178,6 +191,20 @@ class TestSnakeCollision:
         s.set_direction(Direction.UP)
         assert s.check_next_move(20, 20)
 
+    def test_check_next_move_into_vacating_tail(self):
+        # A 2x2 loop: the head steps into the cell the tail leaves this
+        # tick — safe, unless the snake is growing and the tail stays.
+        s = Snake((5, 5), direction=Direction.UP)
+        s.body = [(5, 5), (5, 6), (6, 6), (6, 5)]
+        s.direction = Direction.DOWN
+        assert not s.check_next_move(20, 20)
+        s.move()
+        assert s.get_head() == (6, 5)
+        assert not s.check_collision(20, 20)
+        s.grow_snake()
+        s.direction = Direction.RIGHT
+        assert s.check_next_move(20, 20)
+
 
 class TestSnakeWrap:
     def test_compute_next_head_wraps_right(self):
@@ -221,6 +248,21 @@ class TestSnakeHelpers:
         body.append((99, 99))
         assert (99, 99) not in s.body
 
+    def test_occupied_tracks_body(self):
+        s = Snake((5, 5), length=3, direction=Direction.RIGHT)
+        s.move()
+        s.grow_snake(); s.move()
+        s.shrink(1)
+        assert s.occupied == set(s.body)
+
+    def test_body_assignment_keeps_order(self):
+        # Assigning any sequence replaces the body; head stays at index 0
+        # and moves still push/pop at the right ends.
+        s = Snake((10, 10), direction=Direction.RIGHT)
+        s.body = [(3, 3), (3, 2), (3, 1)]
+        s.move()
+        assert s.get_body() == [(3, 4), (3, 3), (3, 2)]
+
 
 # ── Fruit ──────────────────────────────────────────────────────────────────
 
@@ -246,6 +288,18 @@ class TestFruit:
         f.place(snake_body=body)
         assert f.get_position() not in body
 
+    def test_place_crowded_board_finds_last_free_cell(self):
+        # Snake covers all but one cell — placement must land on it.
+        f = _fruit(width=6, height=4)
+        body = [(r, c) for r in range(4) for c in range(6) if (r, c) != (2, 3)]
+        f.place(snake_body=body)
+        assert f.get_position() == (2, 3)
+
+    def test_place_full_board_keeps_position(self):
+        f = _fruit(width=3, height=3, pos=(1, 1))
+        f.place(snake_body=[(r, c) for r in range(3) for c in range(3)])
+        assert f.get_position() == (1, 1)
+
     def test_check_eaten(self):
         f = _fruit(pos=(15, 15))
         assert f.check_eaten((15, 15))
@@ -307,7 +361,7 @@ class TestPowerUp:
     def test_get_effect_reports_kind_effect(self):
         b = _power(kinds=(SPEED_UP,))
         b.spawn_at((1, 1))
-        assert b.get_effect() == Effect.SPEED_UP
+        assert b.get_effect() is Effect.SPEED_UP
 
 
 class TestSnakeShrink:
@@ -4,7 +4,8 @@ import curses
 import pytest
 from unittest.mock import MagicMock
 
-from snakeclaw.ui import map_key, CursesUI
+from snakeclaw.constants import SNAKE_SEGMENT
+from snakeclaw.ui import map_key, CursesUI, _menu_layout
 from snakeclaw.model import Action, Direction, WallMode
 
 
@@ -97,7 +98,7 @@ class TestCursesUIWithMock:
     def test_get_input_maps_key(self):
         ui = _ui()
         ui.stdscr.getch.return_value = ord('p')
-        assert ui.get_input() == Action.PAUSE
+        assert ui.get_input() is Action.PAUSE
 
     def test_get_input_no_key(self):
         ui = _ui()
@@ -109,6 +110,14 @@ class TestCursesUIWithMock:
         ui.stdscr.getch.side_effect = curses.error()
         assert ui.get_input() is None
 
+    def test_drain_input_collects_queued_keys(self):
+        # Everything typed since the last read comes back in order; unmapped
+        # keys are skipped and the drain stops at the first empty read.
+        ui = _ui()
+        ui.stdscr.getch.side_effect = [curses.KEY_UP, ord('%'),
+                                       curses.KEY_LEFT, -1, ord('p')]
+        assert ui.drain_input() == [Direction.UP, Direction.LEFT]
+
     @pytest.fixture(autouse=False)
     def _patch_acs(self):
         import curses as _c
@@ -150,6 +159,57 @@ class TestCursesUIWithMock:
         )
         assert ui.stdscr.refresh.called
 
+    def test_menu_layout_cached_per_selection(self):
+        # Re-showing the menu with the same inputs reuses the cached layout;
+        # moving the selection produces a different one.
+        ui = _ui()
+        items = ["Start Game", "Help", "Quit"]
+        ui.show_menu(items, 0, 10)
+        first = ui.stdscr.addstr.call_args_list[:]
+        ui.stdscr.reset_mock()
+        ui.show_menu(items, 0, 10)
+        assert ui.stdscr.addstr.call_args_list == first
+        hits = _menu_layout.cache_info().hits
+        ui.show_menu(items, 0, 10)
+        assert _menu_layout.cache_info().hits == hits + 1
+        ui.show_menu(items, 1, 10)
+        assert _menu_layout.cache_info().hits == hits + 1
+
+    def test_draw_snake_coalesces_row_runs(self):
+        # A straight horizontal stretch is one addstr; a gap splits it, and
+        # each row is drawn separately.
+        ui = _ui()
+        ui.draw_snake([(2, 5), (2, 4), (2, 3), (2, 1), (3, 1)])
+        calls = sorted(c.args[:3] for c in ui.stdscr.addstr.call_args_list)
+        seg = SNAKE_SEGMENT
+        assert calls == [(3, 3, seg), (3, 7, seg * 3), (4, 3, seg)]
+
+    def test_hud_stats_line_follows_score(self):
+        # The cached stats line must be rebuilt when the score changes.
+        ui = _ui()
+        row = ui.canvas_h_cells + 2
+        def stats_text():
+            return [c.args[2] for c in ui.stdscr.addstr.call_args_list
+                    if c.args[0] == row][-1]
+        ui.draw_hud(5, 9, 1)
+        assert "Score: 5 " in stats_text()
+        ui.draw_hud(6, 9, 1)
+        assert "Score: 6 " in stats_text()
+
+    def test_hud_stats_line_cached_while_buff_text_unchanged(self):
+        # The buff timer ticks every frame; only a change in the displayed
+        # tenths should rebuild the line.
+        ui = _ui()
+        ui.draw_hud(5, 9, 1, buff_label="FAST", buff_remaining=2.31)
+        line = ui._stats_line
+        ui.draw_hud(5, 9, 1, buff_label="FAST", buff_remaining=2.34)
+        assert ui._stats_line is line
+        ui.draw_hud(5, 9, 1, buff_label="FAST", buff_remaining=2.26)
+        assert ui._stats_line is line  # still shows 2.3s
+        ui.draw_hud(5, 9, 1, buff_label="FAST", buff_remaining=2.14)
+        assert ui._stats_line is not line
+        assert ui._stats_key[-1] == "2.1"
+
     def test_draw_border_per_mode(self):
         # Both wall modes should call into stdscr without raising.
         ui = _ui()
@@ -159,6 +219,17 @@ class TestCursesUIWithMock:
         # many times for each — sanity-check the call count.
         assert ui.stdscr.addstr.call_count > 0
 
+    def test_border_edges_drawn_as_single_runs(self):
+        # Top and bottom edges (with corners) are one addstr each; only the
+        # side walls are per row.
+        ui = _ui()
+        ui.draw_border(wall_mode=WallMode.SOLID)
+        calls = ui.stdscr.addstr.call_args_list
+        assert len(calls) == 2 + 2 * ui.play_h
+        top = calls[0].args
+        assert top[:2] == (0, 0)
+        assert top[2] == "╔" + "═" * ui.screen_w + "╗"
+
     def test_wrap_border_has_no_arrows(self):
         # Wrap walls should be pure dots — no `↔` or `↕` glyphs anymore.
         ui = _ui()
@@ -189,3 +260,35 @@ class TestCursesUIWithMock:
         # rows 12, 13, 14 — strictly below the canvas, never inside the
         # 11-row Classic playfield region.
         assert all(r >= ui.canvas_h_cells + 2 for r in rows)
+
+    def test_render_frame_repaints_only_changed_rows(self, _patch_acs):
+        ui = _ui()
+        ui.render_frame([(5, 5), (5, 4)], (3, 3), 10, 20, 2)
+        ui.stdscr.reset_mock()
+        # Identical frame: nothing to repaint, and no full-screen erase.
+        ui.render_frame([(5, 5), (5, 4)], (3, 3), 10, 20, 2)
+        assert not ui.stdscr.erase.called
+        assert not ui.stdscr.addstr.called
+        assert not ui.stdscr.refresh.called
+        # Snake steps down a row: only its old and new rows are repainted.
+        ui.render_frame([(6, 5), (5, 5)], (3, 3), 10, 20, 2)
+        assert ui.stdscr.refresh.call_count == 1
+        painted = {call.args[0] for call in ui.stdscr.move.call_args_list}
+        assert painted == {ui.play_origin_y + 1 + 5, ui.play_origin_y + 1 + 6}
+
+    def test_paused_frame_refreshes_once(self, _patch_acs):
+        # show_paused() refreshes on its own; inside a frame that must be
+        # folded into the single end-of-frame update.
+        ui = _ui()
+        ui.render_frame([(5, 5)], (3, 3), 10, 20, 2, paused=True)
+        assert ui.stdscr.refresh.call_count == 1
+
+    def test_clear_forces_full_repaint(self, _patch_acs):
+        # An overlay screen erases everything; the next play frame must
+        # redraw every row rather than trust the stale diff.
+        ui = _ui()
+        ui.render_frame([(5, 5)], (3, 3), 10, 20, 2)
+        ui.show_help()
+        ui.stdscr.reset_mock()
+        ui.render_frame([(5, 5)], (3, 3), 10, 20, 2)
+        assert ui.stdscr.move.call_count >= ui.play_h + 2